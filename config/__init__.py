@@ -5,14 +5,17 @@ Configuration is loaded from two sources (in order of precedence):
 2. .env file - Environment-specific & sensitive data (optional overrides)
 
 Usage:
-    from config import FotMobConfig
+    from config import FotMobConfig, get_fotmob_config
     
-    fotmob_config = FotMobConfig()
+    fotmob_config = FotMobConfig()        # fresh, mutable instance
+    shared_config = get_fotmob_config()   # cached, read-only instance
 
 All configuration classes load defaults from config.yaml and can be overridden
 via environment variables in .env. See config.yaml for all available options.
 """
 
+from typing import TYPE_CHECKING
+
 from .base import (
     BaseConfig,
     StorageConfig,
@@ -20,7 +23,10 @@ from .base import (
     MetricsConfig,
     RetryConfig,
 )
-from .fotmob import FotMobConfig
+
+if TYPE_CHECKING:
+    # Resolved lazily by __getattr__ at runtime; imported here for type checkers.
+    from .fotmob import FotMobConfig, get_fotmob_config
 
 __all__ = [
     # Base classes
@@ -31,6 +37,20 @@ __all__ = [
     'RetryConfig',
     # Scraper configs
     'FotMobConfig',
+    'get_fotmob_config',
 ]
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    """Import scraper configs on first access (PEP 562).
+
+    Callers that only need the base classes or ``config.settings`` do not
+    pay for importing the scraper config modules.
+    """
+    if name in ('FotMobConfig', 'get_fotmob_config'):
+        from . import fotmob
+
+        return getattr(fotmob, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,9 +14,11 @@ Features:
 - Validation and defaults
 """
 
+import marshal
 import os
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+import sys
+from dataclasses import asdict, astuple, dataclass, is_dataclass, replace
+from typing import Dict, Any, Optional, List, Set, Tuple
 from pathlib import Path
 from abc import ABC, abstractmethod
 
@@ -26,13 +28,80 @@ try:
 except ImportError:
     pass
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
+
+# Slotted dataclasses drop the per-instance __dict__ and make attribute reads
+# a slot lookup; dataclass(slots=True) needs Python 3.10+.
+_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Accepted spellings for boolean environment overrides (compared lowercased).
+_TRUE_VALUES = frozenset(('1', 'true', 'yes', 'y', 'on'))
+
+# Shared immutable default for RetryConfig.status_codes.
+_DEFAULT_RETRY_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+# Parsed config.yaml documents keyed by path, stored with the (mtime_ns, size)
+# of the file they were parsed from. Repeated config construction reuses one
+# parse, edits to the file are still picked up, and a re-parse replaces the
+# stale entry.
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _yaml_disk_cache_path(config_path: Path) -> Path:
+    """Return the parsed-YAML cache file kept next to config.yaml."""
+    return config_path.parent / '.cache' / f'{config_path.name}.marshal'
 
 
-@dataclass
+def _read_yaml_disk_cache(
+    cache_path: Path, source_key: Tuple[int, int]
+) -> Optional[Dict[str, Any]]:
+    """Return the cached document if it was built from the current YAML file.
+
+    ``source_key`` is the YAML file's ``(st_mtime_ns, st_size)``; a file
+    replaced with the same mtime but different contents usually differs in
+    size, so the snapshot is only trusted when both match.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, config = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return config if cached_key == source_key else None
+
+
+def _write_yaml_disk_cache(
+    cache_path: Path, source_key: Tuple[int, int], config: Dict[str, Any]
+) -> None:
+    """Persist a parsed document; failures only cost a YAML parse next run."""
+    try:
+        payload = marshal.dumps((source_key, config))
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        # Read-only checkouts and YAML values marshal cannot encode
+        # (e.g. timestamps) simply skip the disk cache.
+        pass
+
+
+def _parse_yaml(stream) -> Any:
+    """Parse a YAML stream, importing PyYAML only when a parse is needed."""
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("PyYAML is required. Install with: pip install pyyaml") from None
+    # Prefer the libyaml-backed loader; fall back to the pure-Python one
+    # when PyYAML was built without libyaml.
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _to_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.strip().lower() in _TRUE_VALUES
+
+
+@dataclass(frozen=True, **_SLOTS)
 class StorageConfig:
     """Base storage configuration for data lake architecture."""
     bronze_path: str = ""
@@ -46,7 +115,7 @@ class StorageConfig:
             Path(self.bronze_path).mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LoggingConfig:
     """Standardized logging configuration."""
     level: str = "INFO"
@@ -65,7 +134,7 @@ class LoggingConfig:
         Path(self.file).parent.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class MetricsConfig:
     """Standardized metrics configuration."""
     enabled: bool = False
@@ -77,7 +146,7 @@ class MetricsConfig:
         return
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class RetryConfig:
     """Standardized retry configuration."""
     max_attempts: int = 3
@@ -85,9 +154,7 @@ class RetryConfig:
     max_wait: float = 10.0
     exponential_base: float = 2.0
     backoff_factor: float = 2.0
-    status_codes: tuple = field(
-        default_factory=lambda: (429, 500, 502, 503, 504)
-    )
+    status_codes: tuple = _DEFAULT_RETRY_STATUS_CODES
 
 
 class BaseConfig(ABC):
@@ -101,16 +168,51 @@ class BaseConfig(ABC):
     2. .env file - Environment-specific & sensitive data (overrides)
     """
 
+    # (cwd, directory or section settings) already ensured in this process.
+    _ensured_directories: Set[Any] = set()
+
+    # Sections every subclass sets up in _load_config().
+    storage: StorageConfig
+    logging: LoggingConfig
+    metrics: MetricsConfig
+    retry: RetryConfig
+
+    # Top-level config.yaml sections a subclass cannot run without.
+    _required_yaml_keys: Optional[List[str]] = None
+
     def __init__(self):
         """Initialize configuration from YAML and environment variables."""
-        self._yaml_config = self._load_yaml_config()
+        self._yaml_config = self._load_yaml_config(required_keys=self._required_yaml_keys)
         self._load_config()
         self._apply_env_overrides()
         self._ensure_directories()
 
+    @staticmethod
+    def _resolve_config_path() -> Path:
+        """Return the config.yaml path (CONFIG_FILE_PATH, else the project root).
+
+        Raises:
+            FileNotFoundError: If config.yaml doesn't exist
+        """
+        config_path = Path(os.getenv('CONFIG_FILE_PATH', 'config.yaml'))
+        if not config_path.exists():
+            config_path = Path(__file__).parent.parent / 'config.yaml'
+
+        if not config_path.exists():
+            raise FileNotFoundError(
+                f"config.yaml not found at {config_path}. "
+                f"Please create config.yaml with required settings."
+            )
+        return config_path
+
     @staticmethod
     def _load_yaml_config(required_keys: Optional[List[str]] = None) -> Dict[str, Any]:
         """Load configuration from config.yaml file.
+
+        The parsed document is cached per path, modification time and size,
+        so constructing several configs in one process parses the file once.
+        A marshal snapshot under ``.cache/`` next to config.yaml lets later
+        processes skip the YAML parse until the file changes.
         
         Args:
             required_keys: List of required top-level keys. If missing, raises error.
@@ -122,21 +224,21 @@ class BaseConfig(ABC):
             FileNotFoundError: If config.yaml doesn't exist
             ValueError: If required keys are missing from config.yaml
         """
-        config_path = os.getenv('CONFIG_FILE_PATH', 'config.yaml')
-        if not Path(config_path).exists():
-            config_path = Path(__file__).parent.parent / 'config.yaml'
-        
-        if not Path(config_path).exists():
-            raise FileNotFoundError(
-                f"config.yaml not found at {config_path}. "
-                f"Please create config.yaml with required settings."
-            )
-        
-        if yaml is None:
-            raise ImportError("PyYAML is required. Install with: pip install pyyaml")
-        
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f) or {}
+        config_path = BaseConfig._resolve_config_path()
+
+        st = config_path.stat()
+        source_key = (st.st_mtime_ns, st.st_size)
+        cache_key = str(config_path)
+        cached = _YAML_CACHE.get(cache_key)
+        config = cached[1] if cached is not None and cached[0] == source_key else None
+        if config is None:
+            disk_cache_path = _yaml_disk_cache_path(config_path)
+            config = _read_yaml_disk_cache(disk_cache_path, source_key)
+            if config is None:
+                with open(config_path, 'r') as f:
+                    config = _parse_yaml(f) or {}
+                _write_yaml_disk_cache(disk_cache_path, source_key, config)
+            _YAML_CACHE[cache_key] = (source_key, config)
         
         if required_keys:
             missing = [k for k in required_keys if k not in config]
@@ -148,12 +250,34 @@ class BaseConfig(ABC):
         
         return config
 
+    @classmethod
+    def clear_yaml_cache(cls) -> None:
+        """Drop cached config.yaml documents so the next load re-parses the file.
+
+        Empties the in-process cache and deletes the ``.cache/`` marshal
+        snapshots of every cached path and of the currently resolved
+        config.yaml, so a rewrite that kept the same mtime and size is not
+        served from disk either.
+        """
+        config_paths = {Path(path) for path in _YAML_CACHE}
+        _YAML_CACHE.clear()
+        try:
+            config_paths.add(cls._resolve_config_path())
+        except FileNotFoundError:
+            pass
+        for config_path in config_paths:
+            try:
+                _yaml_disk_cache_path(config_path).unlink()
+            except FileNotFoundError:
+                pass
+
     @abstractmethod
     def _load_config(self) -> None:
         """Initialize configuration with defaults.
 
         Subclasses must implement this method to set up their specific
-        configuration attributes (storage, logging, retry, etc.).
+        configuration attributes. At minimum storage, logging, metrics and
+        retry must be set; the base class relies on them.
 
         This method is called before _apply_env_overrides() and
         _ensure_directories() during __init__.
@@ -171,67 +295,48 @@ class BaseConfig(ABC):
 
         Pattern: {SCRAPER_NAME}_{CONFIG_KEY} (e.g., FOTMOB_X_MAS_TOKEN)
         """
-        if hasattr(self, 'logging') and isinstance(self.logging, LoggingConfig):
-            if os.getenv('LOG_LEVEL'):
-                self.logging.level = os.getenv('LOG_LEVEL')
-            if os.getenv('LOG_FILE'):
-                self.logging.file = os.getenv('LOG_FILE')
-
-        if hasattr(self, 'metrics') and isinstance(self.metrics, MetricsConfig):
-            if os.getenv('METRICS_ENABLED'):
-                self.metrics.enabled = (
-                    os.getenv('METRICS_ENABLED').lower() == 'true'
-                )
+        env = os.environ
+
+        log_level = env.get('LOG_LEVEL')
+        if log_level:
+            self.logging.level = log_level
+        log_file = env.get('LOG_FILE')
+        if log_file:
+            self.logging.file = log_file
+
+        metrics_enabled = env.get('METRICS_ENABLED')
+        if metrics_enabled:
+            self.metrics = replace(self.metrics, enabled=_to_bool(metrics_enabled))
 
     def _ensure_directories(self):
-        """Ensure all required directories exist."""
+        """Ensure all required directories exist.
+
+        Work already done by an earlier config instance in this process is
+        remembered in ``_ensured_directories`` and skipped.
+        """
+        cwd = os.getcwd()
         data_path = Path("data")
 
-        if data_path.exists():
-            if data_path.is_dir():
-                pass
-            elif data_path.is_file():
-                raise OSError(
-                    f"Cannot create directory 'data': A file with that name "
-                    f"already exists. Path: {data_path.absolute()}. "
-                    f"Please remove or rename the file."
-                )
-            else:
-                raise OSError(
-                    f"Cannot create directory 'data': A non-directory with "
-                    f"that name already exists. Path: {data_path.absolute()}. "
-                    f"Please remove or rename it."
-                )
-        else:
+        if (cwd, data_path) not in BaseConfig._ensured_directories:
             try:
                 data_path.mkdir(parents=True, exist_ok=True)
             except FileExistsError as e:
-                if data_path.exists() and data_path.is_dir():
-                    pass
-                else:
-                    raise OSError(
-                        f"Cannot create directory 'data': A file or "
-                        f"non-directory with that name exists. "
-                        f"Path: {data_path.absolute()}. "
-                        f"Please remove or rename it."
-                    ) from e
-            except OSError as e:
-                if e.errno == 17:
-                    if data_path.exists() and data_path.is_dir():
-                        pass
-                    else:
-                        raise OSError(
-                            f"Cannot create directory 'data': A file or "
-                            f"non-directory with that name exists. "
-                            f"Path: {data_path.absolute()}. "
-                            f"Please remove or rename it."
-                        ) from e
-                else:
-                    raise
+                # With exist_ok=True this is only raised when 'data' exists
+                # but is not a directory.
+                raise OSError(
+                    f"Cannot create directory 'data': A file or "
+                    f"non-directory with that name already exists. "
+                    f"Path: {data_path.absolute()}. "
+                    f"Please remove or rename it."
+                ) from e
+            BaseConfig._ensured_directories.add((cwd, data_path))
 
-        for field_name, field_value in self.__dict__.items():
+        for field_value in self.__dict__.values():
             if isinstance(field_value, (StorageConfig, LoggingConfig)):
-                field_value.ensure_directories()
+                ensured_key = (cwd, type(field_value), astuple(field_value))
+                if ensured_key not in BaseConfig._ensured_directories:
+                    field_value.ensure_directories()
+                    BaseConfig._ensured_directories.add(ensured_key)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -244,11 +349,8 @@ class BaseConfig(ABC):
         for field_name, field_value in self.__dict__.items():
             if field_name.startswith('_'):
                 continue
-            if isinstance(
-                field_value,
-                (StorageConfig, LoggingConfig, MetricsConfig, RetryConfig)
-            ):
-                result[field_name] = field_value.__dict__
+            if is_dataclass(field_value) and not isinstance(field_value, type):
+                result[field_name] = asdict(field_value)
             elif isinstance(
                 field_value, (list, dict, str, int, float, bool, type(None))
             ):
@@ -13,13 +13,60 @@ All non-sensitive settings must be defined in config.yaml.
 import json
 import os
 import random
-from dataclasses import dataclass, field
-from typing import Dict, List
-
-from .base import BaseConfig, LoggingConfig, MetricsConfig, RetryConfig, StorageConfig
-
-
-@dataclass
+import re
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from .base import (
+    _DEFAULT_RETRY_STATUS_CODES,
+    _SLOTS,
+    BaseConfig,
+    LoggingConfig,
+    MetricsConfig,
+    RetryConfig,
+    StorageConfig,
+    _to_bool,
+)
+
+
+_CSV_SPLIT = re.compile(r"\s*,\s*").split
+
+
+def _to_str_frozenset(value: str) -> FrozenSet[str]:
+    """Parse a comma-separated environment variable value into a frozenset."""
+    return frozenset(item for item in _CSV_SPLIT(value.strip()) if item)
+
+
+# Static API request headers in send order; Referer, User-Agent and x-mas are
+# filled in per request by ApiConfig.get_headers.
+_API_HEADER_TEMPLATE: Dict[str, str] = {
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9,fa;q=0.8",
+    "priority": "u=1, i",
+    "sec-ch-ua-platform": '"macOS"',
+    "Referer": "",
+    "User-Agent": "",
+    "x-mas": "",
+    "sec-ch-ua": '"Not(A:Brand";v="8", "Chromium";v="144", "Google Chrome";v="144"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+}
+
+
+@lru_cache(maxsize=16)
+def _format_cookie_header(cookies_input: str) -> str:
+    """Convert JSON cookies to cookie header format, once per distinct value."""
+    try:
+        cookies_dict = json.loads(cookies_input)
+        return "; ".join(f"{k}={v}" for k, v in cookies_dict.items())
+    except (json.JSONDecodeError, AttributeError):
+        return cookies_input
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ApiConfig:
     """FotMob API configuration."""
 
@@ -27,39 +74,26 @@ class ApiConfig:
     user_agent: str
     x_mas_token: str = ""
     cookies: str = ""
-    user_agents: List[str] = field(default_factory=list)
+    user_agents: Tuple[str, ...] = ()
 
     def get_headers(self, referer: str = "https://www.fotmob.com/") -> Dict[str, str]:
         """Get HTTP headers for API requests with random User-Agent."""
-        user_agent = random.choice(self.user_agents) if self.user_agents else self.user_agent
-        headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9,fa;q=0.8",
-            "priority": "u=1, i",
-            "sec-ch-ua-platform": '"macOS"',
-            "Referer": referer,
-            "User-Agent": user_agent,
-            "x-mas": self.x_mas_token,
-            "sec-ch-ua": '"Not(A:Brand";v="8", "Chromium";v="144", "Google Chrome";v="144"',
-            "sec-ch-ua-mobile": "?0",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-        }
+        headers = _API_HEADER_TEMPLATE.copy()
+        headers["Referer"] = referer
+        headers["User-Agent"] = (
+            random.choice(self.user_agents) if self.user_agents else self.user_agent
+        )
+        headers["x-mas"] = self.x_mas_token
         if self.cookies:
-            headers["Cookie"] = self._format_cookies(self.cookies)
+            headers["Cookie"] = _format_cookie_header(self.cookies)
         return headers
 
     def _format_cookies(self, cookies_input: str) -> str:
         """Convert JSON cookies to cookie header format."""
-        try:
-            cookies_dict = json.loads(cookies_input)
-            return "; ".join(f"{k}={v}" for k, v in cookies_dict.items())
-        except (json.JSONDecodeError, AttributeError):
-            return cookies_input
+        return _format_cookie_header(cookies_input)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class RequestConfig:
     """HTTP request configuration."""
 
@@ -68,7 +102,7 @@ class RequestConfig:
     delay_max: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrapingConfig:
     """Scraping behavior configuration."""
 
@@ -76,12 +110,12 @@ class ScrapingConfig:
     enable_parallel: bool
     metrics_update_interval: int
     filter_by_status: bool
-    allowed_match_statuses: tuple
+    allowed_match_statuses: FrozenSet[str]
     enable_caching: bool = True
     cache_ttl_hours: int = 24
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class DataQualityConfig:
     """Data quality checking configuration."""
 
@@ -89,7 +123,7 @@ class DataQualityConfig:
     fail_on_issues: bool
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ProxyConfig:
     """Proxy configuration."""
 
@@ -98,6 +132,41 @@ class ProxyConfig:
     https: str = ""
 
 
+# Fallbacks for optional keys under fotmob.<section> in config.yaml. Section
+# fields without a fallback here must be set in config.yaml.
+_SECTION_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "scraping": {"enable_caching": True, "cache_ttl_hours": 24},
+    "storage": {"enabled": True},
+    "retry": {
+        "exponential_base": 2.0,
+        "backoff_factor": 2.0,
+        "status_codes": _DEFAULT_RETRY_STATUS_CODES,
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "file": "logs/fotmob_scraper.log",
+        "max_bytes": 10485760,
+        "backup_count": 5,
+        "dir": "logs",
+    },
+    "metrics": {"enabled": False, "export_path": "metrics", "export_format": "json"},
+    "data_quality": {"enabled": True, "fail_on_issues": False},
+    "proxy": {"enabled": False, "http": "", "https": ""},
+}
+
+
+def _section_kwargs(yaml_fotmob: Dict[str, Any], section: str, section_cls: type) -> Dict[str, Any]:
+    """Merge fotmob.<section> from config.yaml over its fallbacks into constructor kwargs."""
+    merged = {**_SECTION_DEFAULTS.get(section, {}), **(yaml_fotmob.get(section) or {})}
+    kwargs = {}
+    for section_field in fields(section_cls):
+        if section_field.name not in merged:
+            raise ValueError(f"fotmob.{section}.{section_field.name} is required in config.yaml")
+        kwargs[section_field.name] = merged[section_field.name]
+    return kwargs
+
+
 class FotMobConfig(BaseConfig):
     """
 
@@ -118,15 +187,42 @@ class FotMobConfig(BaseConfig):
 
     """
 
-    def __init__(self):
-        """Initialize FotMob configuration from config.yaml."""
-        self._yaml_config = self._load_yaml_config(required_keys=["fotmob"])
-        self._load_config()
-        self._apply_env_overrides()
-        self._ensure_directories()
+    _required_yaml_keys = ["fotmob"]
+
+    # (env var, (section, attribute), converter) applied by _apply_env_overrides.
+    _ENV_OVERRIDES: Tuple[Tuple[str, Tuple[str, str], Callable[[str], Any]], ...] = (
+        ("FOTMOB_X_MAS_TOKEN", ("api", "x_mas_token"), str),
+        ("FOTMOB_COOKIES", ("api", "cookies"), str),
+        ("FOTMOB_USER_AGENT", ("api", "user_agent"), str),
+        ("FOTMOB_API_BASE_URL", ("api", "base_url"), str),
+        ("FOTMOB_REQUEST_TIMEOUT", ("request", "timeout"), int),
+        ("FOTMOB_DELAY_MIN", ("request", "delay_min"), float),
+        ("FOTMOB_DELAY_MAX", ("request", "delay_max"), float),
+        ("FOTMOB_MAX_WORKERS", ("scraping", "max_workers"), int),
+        ("FOTMOB_ENABLE_PARALLEL", ("scraping", "enable_parallel"), _to_bool),
+        ("FOTMOB_ENABLE_CACHING", ("scraping", "enable_caching"), _to_bool),
+        ("FOTMOB_CACHE_TTL_HOURS", ("scraping", "cache_ttl_hours"), int),
+        ("FOTMOB_METRICS_UPDATE_INTERVAL", ("scraping", "metrics_update_interval"), int),
+        ("FOTMOB_FILTER_BY_STATUS", ("scraping", "filter_by_status"), _to_bool),
+        (
+            "FOTMOB_ALLOWED_MATCH_STATUSES",
+            ("scraping", "allowed_match_statuses"),
+            _to_str_frozenset,
+        ),
+        ("FOTMOB_BRONZE_PATH", ("storage", "bronze_path"), str),
+        ("FOTMOB_STORAGE_ENABLED", ("storage", "enabled"), _to_bool),
+        ("FOTMOB_RETRY_MAX_ATTEMPTS", ("retry", "max_attempts"), int),
+        ("FOTMOB_RETRY_INITIAL_WAIT", ("retry", "initial_wait"), float),
+        ("FOTMOB_RETRY_MAX_WAIT", ("retry", "max_wait"), float),
+        ("FOTMOB_DATA_QUALITY_ENABLED", ("data_quality", "enabled"), _to_bool),
+        ("FOTMOB_DATA_QUALITY_FAIL_ON_ISSUES", ("data_quality", "fail_on_issues"), _to_bool),
+        ("FOTMOB_PROXY_ENABLED", ("proxy", "enabled"), _to_bool),
+        ("FOTMOB_PROXY_HTTP", ("proxy", "http"), str),
+        ("FOTMOB_PROXY_HTTPS", ("proxy", "https"), str),
+    )
 
     def _load_config(self):
-        """Initialize configuration from config.yaml (no defaults)."""
+        """Initialize configuration from config.yaml and _SECTION_DEFAULTS."""
         yaml_fotmob = self._yaml_config.get("fotmob", {})
 
         api_config = yaml_fotmob.get("api", {})
@@ -139,135 +235,40 @@ class FotMobConfig(BaseConfig):
             base_url=api_config["base_url"],
             user_agent=api_config.get("user_agent", ""),
             x_mas_token="",
-            user_agents=api_config["user_agents"],
+            user_agents=tuple(api_config["user_agents"]),
         )
 
-        request_config = yaml_fotmob.get("request", {})
-        self.request = RequestConfig(
-            timeout=request_config["timeout"],
-            delay_min=request_config["delay_min"],
-            delay_max=request_config["delay_max"],
-        )
-
-        scraping_config = yaml_fotmob.get("scraping", {})
-        self.scraping = ScrapingConfig(
-            max_workers=scraping_config["max_workers"],
-            enable_parallel=scraping_config["enable_parallel"],
-            enable_caching=scraping_config.get("enable_caching", True),
-            cache_ttl_hours=scraping_config.get("cache_ttl_hours", 24),
-            metrics_update_interval=scraping_config["metrics_update_interval"],
-            filter_by_status=scraping_config["filter_by_status"],
-            allowed_match_statuses=tuple(scraping_config["allowed_match_statuses"]),
-        )
-
-        storage_config = yaml_fotmob.get("storage", {})
-        bronze_path = storage_config["bronze_path"]
-        self.storage = StorageConfig(
-            bronze_path=bronze_path,
-            enabled=storage_config.get("enabled", True),
-        )
+        self.request = RequestConfig(**_section_kwargs(yaml_fotmob, "request", RequestConfig))
 
-        retry_config = yaml_fotmob.get("retry", {})
-        self.retry = RetryConfig(
-            max_attempts=retry_config["max_attempts"],
-            initial_wait=retry_config["initial_wait"],
-            max_wait=retry_config["max_wait"],
-            exponential_base=retry_config.get("exponential_base", 2.0),
-            backoff_factor=retry_config.get("backoff_factor", 2.0),
-            status_codes=tuple(retry_config.get("status_codes", [429, 500, 502, 503, 504])),
+        scraping_kwargs = _section_kwargs(yaml_fotmob, "scraping", ScrapingConfig)
+        scraping_kwargs["allowed_match_statuses"] = frozenset(
+            scraping_kwargs["allowed_match_statuses"]
         )
+        self.scraping = ScrapingConfig(**scraping_kwargs)
 
-        fotmob_logging = yaml_fotmob.get("logging", {})
-        self.logging = LoggingConfig(
-            level=fotmob_logging.get("level", "INFO"),
-            format=fotmob_logging.get(
-                "format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            ),
-            file=fotmob_logging.get("file", "logs/fotmob_scraper.log"),
-            max_bytes=fotmob_logging.get("max_bytes", 10485760),
-            backup_count=fotmob_logging.get("backup_count", 5),
-            dir=fotmob_logging.get("dir", "logs"),
-        )
+        self.storage = StorageConfig(**_section_kwargs(yaml_fotmob, "storage", StorageConfig))
 
-        fotmob_metrics = yaml_fotmob.get("metrics", {})
-        self.metrics = MetricsConfig(
-            enabled=fotmob_metrics.get("enabled", False),
-            export_path=fotmob_metrics.get("export_path", "metrics"),
-            export_format=fotmob_metrics.get("export_format", "json"),
-        )
+        retry_kwargs = _section_kwargs(yaml_fotmob, "retry", RetryConfig)
+        retry_kwargs["status_codes"] = tuple(retry_kwargs["status_codes"])
+        self.retry = RetryConfig(**retry_kwargs)
 
-        data_quality_config = yaml_fotmob.get("data_quality", {})
+        self.logging = LoggingConfig(**_section_kwargs(yaml_fotmob, "logging", LoggingConfig))
+        self.metrics = MetricsConfig(**_section_kwargs(yaml_fotmob, "metrics", MetricsConfig))
         self.data_quality = DataQualityConfig(
-            enabled=data_quality_config.get("enabled", True),
-            fail_on_issues=data_quality_config.get("fail_on_issues", False),
-        )
-
-        proxy_config = yaml_fotmob.get("proxy", {})
-        self.proxy = ProxyConfig(
-            enabled=proxy_config.get("enabled", False),
+            **_section_kwargs(yaml_fotmob, "data_quality", DataQualityConfig)
         )
+        self.proxy = ProxyConfig(**_section_kwargs(yaml_fotmob, "proxy", ProxyConfig))
 
     def _apply_env_overrides(self):
         """Apply environment variable overrides for sensitive data."""
         super()._apply_env_overrides()
 
-        if os.getenv("FOTMOB_X_MAS_TOKEN"):
-            self.api.x_mas_token = os.getenv("FOTMOB_X_MAS_TOKEN")
-        if os.getenv("FOTMOB_COOKIES"):
-            self.api.cookies = os.getenv("FOTMOB_COOKIES")
-        if os.getenv("FOTMOB_USER_AGENT"):
-            self.api.user_agent = os.getenv("FOTMOB_USER_AGENT")
-        if os.getenv("FOTMOB_API_BASE_URL"):
-            self.api.base_url = os.getenv("FOTMOB_API_BASE_URL")
-
-        if os.getenv("FOTMOB_REQUEST_TIMEOUT"):
-            self.request.timeout = int(os.getenv("FOTMOB_REQUEST_TIMEOUT"))
-        if os.getenv("FOTMOB_DELAY_MIN"):
-            self.request.delay_min = float(os.getenv("FOTMOB_DELAY_MIN"))
-        if os.getenv("FOTMOB_DELAY_MAX"):
-            self.request.delay_max = float(os.getenv("FOTMOB_DELAY_MAX"))
-
-        if os.getenv("FOTMOB_MAX_WORKERS"):
-            self.scraping.max_workers = int(os.getenv("FOTMOB_MAX_WORKERS"))
-        if os.getenv("FOTMOB_ENABLE_PARALLEL"):
-            self.scraping.enable_parallel = os.getenv("FOTMOB_ENABLE_PARALLEL").lower() == "true"
-        if os.getenv("FOTMOB_ENABLE_CACHING"):
-            self.scraping.enable_caching = os.getenv("FOTMOB_ENABLE_CACHING").lower() == "true"
-        if os.getenv("FOTMOB_CACHE_TTL_HOURS"):
-            self.scraping.cache_ttl_hours = int(os.getenv("FOTMOB_CACHE_TTL_HOURS"))
-        if os.getenv("FOTMOB_METRICS_UPDATE_INTERVAL"):
-            self.scraping.metrics_update_interval = int(os.getenv("FOTMOB_METRICS_UPDATE_INTERVAL"))
-        if os.getenv("FOTMOB_FILTER_BY_STATUS"):
-            self.scraping.filter_by_status = os.getenv("FOTMOB_FILTER_BY_STATUS").lower() == "true"
-        if os.getenv("FOTMOB_ALLOWED_MATCH_STATUSES"):
-            statuses = [s.strip() for s in os.getenv("FOTMOB_ALLOWED_MATCH_STATUSES").split(",")]
-            self.scraping.allowed_match_statuses = tuple(statuses)
-
-        if os.getenv("FOTMOB_BRONZE_PATH"):
-            self.storage.bronze_path = os.getenv("FOTMOB_BRONZE_PATH")
-        if os.getenv("FOTMOB_STORAGE_ENABLED"):
-            self.storage.enabled = os.getenv("FOTMOB_STORAGE_ENABLED").lower() == "true"
-
-        if os.getenv("FOTMOB_RETRY_MAX_ATTEMPTS"):
-            self.retry.max_attempts = int(os.getenv("FOTMOB_RETRY_MAX_ATTEMPTS"))
-        if os.getenv("FOTMOB_RETRY_INITIAL_WAIT"):
-            self.retry.initial_wait = float(os.getenv("FOTMOB_RETRY_INITIAL_WAIT"))
-        if os.getenv("FOTMOB_RETRY_MAX_WAIT"):
-            self.retry.max_wait = float(os.getenv("FOTMOB_RETRY_MAX_WAIT"))
-
-        if os.getenv("FOTMOB_DATA_QUALITY_ENABLED"):
-            self.data_quality.enabled = os.getenv("FOTMOB_DATA_QUALITY_ENABLED").lower() == "true"
-        if os.getenv("FOTMOB_DATA_QUALITY_FAIL_ON_ISSUES"):
-            self.data_quality.fail_on_issues = (
-                os.getenv("FOTMOB_DATA_QUALITY_FAIL_ON_ISSUES").lower() == "true"
-            )
-
-        if os.getenv("FOTMOB_PROXY_ENABLED"):
-            self.proxy.enabled = os.getenv("FOTMOB_PROXY_ENABLED").lower() == "true"
-        if os.getenv("FOTMOB_PROXY_HTTP"):
-            self.proxy.http = os.getenv("FOTMOB_PROXY_HTTP")
-        if os.getenv("FOTMOB_PROXY_HTTPS"):
-            self.proxy.https = os.getenv("FOTMOB_PROXY_HTTPS")
+        env = os.environ
+        for env_name, (section, attr), convert in self._ENV_OVERRIDES:
+            value = env.get(env_name)
+            if value:
+                # Frozen sections are rebuilt rather than mutated in place.
+                setattr(self, section, replace(getattr(self, section), **{attr: convert(value)}))
 
     @property
     def api_base_url(self) -> str:
@@ -285,7 +286,7 @@ class FotMobConfig(BaseConfig):
         return self.api.x_mas_token
 
     @property
-    def user_agents(self) -> List[str]:
+    def user_agents(self) -> Tuple[str, ...]:
         """Backward compatibility: api.user_agents"""
         return self.api.user_agents
 
@@ -335,7 +336,7 @@ class FotMobConfig(BaseConfig):
         return self.scraping.filter_by_status
 
     @property
-    def allowed_match_statuses(self) -> tuple:
+    def allowed_match_statuses(self) -> FrozenSet[str]:
         """Backward compatibility: scraping.allowed_match_statuses"""
         return self.scraping.allowed_match_statuses
 
@@ -404,3 +405,23 @@ class FotMobConfig(BaseConfig):
     def get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for API requests."""
         return self.api.get_headers()
+
+
+_shared_config: Optional[FotMobConfig] = None
+_shared_config_mtime_ns: int = 0
+
+
+def get_fotmob_config() -> FotMobConfig:
+    """Return a process-wide FotMobConfig, rebuilt when config.yaml changes.
+
+    The shared instance must be treated as read-only. Callers that adjust
+    settings at runtime (e.g. forcing sequential scraping) should construct
+    their own ``FotMobConfig()``.
+    """
+    global _shared_config, _shared_config_mtime_ns
+
+    mtime_ns = FotMobConfig._resolve_config_path().stat().st_mtime_ns
+    if _shared_config is None or mtime_ns != _shared_config_mtime_ns:
+        _shared_config = FotMobConfig()
+        _shared_config_mtime_ns = mtime_ns
+    return _shared_config
@@ -99,7 +99,11 @@ class Settings(BaseSettings):
         return self.environment == Environment.TESTING
     
     def ensure_directories(self):
-        """Create required directories if they don't exist."""
+        """Create required directories if they don't exist.
+
+        Not run on import; entry points that write under data_dir or
+        log_dir without creating them should call this once at startup.
+        """
         Path(self.data_dir).mkdir(parents=True, exist_ok=True)
         Path(self.log_dir).mkdir(parents=True, exist_ok=True)
     
@@ -121,7 +125,5 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-settings.ensure_directories()
-
 
 __all__ = ['settings', 'Settings', 'Environment']
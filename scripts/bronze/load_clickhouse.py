@@ -42,7 +42,7 @@ sys.path.insert(0, str(project_root))
 
 import pandas as pd
 
-from config import FotMobConfig
+from config import get_fotmob_config
 from src.processors.bronze.match_processor import FotMobBronzeMatchProcessor
 from src.storage.bronze.fotmob import FotMobBronzeStorage
 from src.storage.clickhouse_client import ClickHouseClient
@@ -833,7 +833,7 @@ def load_fotmob_data(
 
     stats = {}
     try:
-        config = FotMobConfig()
+        config = get_fotmob_config()
         bronze_storage = FotMobBronzeStorage(config.storage.bronze_path)
         processor = FotMobBronzeMatchProcessor()
 
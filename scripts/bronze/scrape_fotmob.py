@@ -389,8 +389,8 @@ def run_scraping(args: argparse.Namespace) -> int:
     # Setup logging
     logger = setup_logging(
         name="bronze_processing",
-        log_dir=config.log_dir,
-        log_level=config.log_level,
+        log_dir=config.logging.dir,
+        log_level=config.logging.level,
     )
 
     # Print header
@@ -170,7 +170,7 @@ class FotMobOrchestrator(OrchestratorProtocol):
             else:
                 match_ids_to_scrape = [str(m) for m in match_ids]
 
-            if self.config.enable_parallel and len(match_ids_to_scrape) > 1:
+            if self.config.scraping.enable_parallel and len(match_ids_to_scrape) > 1:
                 self._scrape_matches_parallel(
                     match_ids_to_scrape, metrics, date_str, scraped_match_ids
                 )
@@ -508,7 +508,7 @@ class FotMobOrchestrator(OrchestratorProtocol):
             extra={
                 "date": date_str,
                 "match_count": len(match_ids),
-                "max_workers": self.config.max_workers,
+                "max_workers": self.config.scraping.max_workers,
             },
         )
 
@@ -540,7 +540,7 @@ class FotMobOrchestrator(OrchestratorProtocol):
             return self._process_match_with_scraper(scraper, match_id, date_str)
 
         try:
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            with ThreadPoolExecutor(max_workers=self.config.scraping.max_workers) as executor:
                 future_to_match = {}
                 for match_id in match_ids_to_scrape:
                     future = executor.submit(_worker, match_id)
@@ -645,7 +645,7 @@ class FotMobOrchestrator(OrchestratorProtocol):
 
             # Run data quality checks if enabled
             quality_issues = None
-            if self.processor and self.config.enable_data_quality_checks:
+            if self.processor and self.config.data_quality.enabled:
                 try:
                     dataframes, _ = self.processor.process_all(raw_data)
                     validation_results = DataQualityChecker.validate_all_dataframes(dataframes)
@@ -656,7 +656,7 @@ class FotMobOrchestrator(OrchestratorProtocol):
                         for issue in result.get("issues", [])
                     ]
 
-                    if quality_issues and self.config.fail_on_quality_issues:
+                    if quality_issues and self.config.data_quality.fail_on_issues:
                         return False, f"Data quality issues: {quality_issues}", quality_issues
                 except Exception as e:
                     self.logger.warning(
@@ -30,6 +30,10 @@ from ...utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+_FULL_SCORE_RE = re.compile(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
+_YEAR_PREFIX_RE = re.compile(r"^\s*(\d{4})")
+_DATE_PREFIX_RE = re.compile(r"^\s*(\d{4}-\d{2}-\d{2})")
+
 
 # Period statistics key mapping: API key -> (home_field, away_field)
 PERIOD_STAT_KEY_MAPPING: Dict[str, Tuple[str, str]] = {
@@ -154,7 +158,7 @@ class FotMobBronzeMatchProcessor(ProcessorProtocol):
         if not full_score:
             return None, None
 
-        match = re.match(r"^\s*(\d+)\s*-\s*(\d+)\s*$", str(full_score))
+        match = _FULL_SCORE_RE.match(str(full_score))
         if not match:
             return None, None
 
@@ -165,7 +169,7 @@ class FotMobBronzeMatchProcessor(ProcessorProtocol):
         """Extract YYYY from ISO-like datetime strings."""
         if not value:
             return None
-        match = re.match(r"^\s*(\d{4})", str(value))
+        match = _YEAR_PREFIX_RE.match(str(value))
         return match.group(1) if match else None
 
     def _generate_synthetic_lineup_player_id(
@@ -386,7 +390,7 @@ class FotMobBronzeMatchProcessor(ProcessorProtocol):
         for raw_value in (match_time_utc_date, match_time_utc):
             if not raw_value:
                 continue
-            date_match = re.match(r"^\s*(\d{4}-\d{2}-\d{2})", str(raw_value))
+            date_match = _DATE_PREFIX_RE.match(str(raw_value))
             if date_match:
                 return date_match.group(1)
         return "1970-01-01"
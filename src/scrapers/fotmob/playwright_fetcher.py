@@ -22,9 +22,10 @@ fingerprint, bypassing Cloudflare's TLS-based bot detection.
 import base64
 import hashlib
 import json
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
 
 from ...utils.logging_utils import get_logger
@@ -32,6 +33,48 @@ from ...utils.logging_utils import get_logger
 logger = get_logger(__name__)
 
 
+# Project-root credentials file; scripts/refresh_turnstile.py replaces it
+# atomically whenever the turnstile_verified cookie is refreshed.
+_CREDENTIALS_PATH = Path(__file__).parent.parent.parent.parent / "credentials.json"
+
+
+# Finds FotMob's x-mas signing module among the loaded webpack chunks and
+# returns {foo, h}, or null while that chunk has not loaded yet.
+_SIGNING_PARAMS_JS = """
+    () => {
+        for (const chunk of (window.webpackChunk_N_E || [])) {
+            const mm = chunk[1];
+            if (!mm) continue;
+            for (const [, factory] of Object.entries(mm)) {
+                const code = factory.toString();
+                if (code.includes('"x-mas"')) {
+                    const fm = code.match(/"production:([a-f0-9]{40})"/);
+                    const hi = code.indexOf('h=`') + 3;
+                    return {
+                        foo: fm ? fm[1] : null,
+                        h: code.substring(hi, code.indexOf('`', hi))
+                    };
+                }
+            }
+        }
+        return null;
+    }
+"""
+
+
+# Resource types the Playwright sessions never need: only the HTML and the
+# webpack scripts matter for signing-param extraction and cookie warm-up.
+_BLOCKED_RESOURCE_TYPES = frozenset(("image", "media", "font", "stylesheet"))
+
+
+def _skip_static_assets(route) -> None:
+    """Playwright route handler that aborts image, media, font and CSS requests."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
 def _turnstile_created_at(value: str) -> int:
     """Extract creation timestamp from turnstile token, or -1 if unknown."""
     parts = value.split(".")
@@ -142,6 +185,11 @@ class PlaywrightFetcher:
     FOTMOB_BASE = "https://www.fotmob.com"
     TURNSTILE_EXPIRY_SECONDS = 3600
     SIGNING_PARAMS_TTL = 86_400  # refresh once per day
+    CHROME_COOKIES_TTL = 60  # re-read Chrome's cookie store at most once a minute
+
+    # (foo, h, extracted_at) from the last successful extraction in this process.
+    _shared_signing_params: Optional[Tuple[str, str, float]] = None
+    _signing_params_lock = threading.Lock()
 
     def __init__(self, config):
         self.config = config
@@ -150,6 +198,11 @@ class PlaywrightFetcher:
         self._foo_hash: Optional[str] = None
         self._h_lyrics: Optional[str] = None
         self._signing_params_ts: float = 0.0
+        self._session = None
+        self._chrome_cookies: Optional[Dict[str, str]] = None
+        self._chrome_cookies_ts: float = 0.0
+        # ((mtime_ns, size), cookies) from the last credentials.json parse.
+        self._credentials_cache: Optional[Tuple[Tuple[int, int], Dict[str, str]]] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -167,7 +220,7 @@ class PlaywrightFetcher:
         """Make an authenticated GET request and return the parsed JSON body."""
         self._ensure_signing_params()
 
-        api_path = "/api/data/" + url.split("/api/data/")[-1]
+        api_path = "/api/data/" + url.rpartition("/api/data/")[2]
         if params:
             qs = urlencode(params, doseq=True)
             url_path = f"{api_path}?{qs}"
@@ -192,9 +245,7 @@ class PlaywrightFetcher:
         self.logger.debug(f"GET {url_path}")
 
         try:
-            from curl_cffi import requests as curl_requests
-
-            resp = curl_requests.get(
+            resp = self._get_session().get(
                 full_url,
                 headers=headers,
                 cookies=cookies,
@@ -256,6 +307,7 @@ class PlaywrightFetcher:
                             ]
                         )
                     page = context.new_page()
+                    page.route("**/*", _skip_static_assets)
                     page.goto(self.FOTMOB_BASE, wait_until="domcontentloaded", timeout=30_000)
 
                     resp = context.request.get(full_url, timeout=self.config.request.timeout * 1000)
@@ -273,12 +325,24 @@ class PlaywrightFetcher:
             return None
 
     def close(self):
-        """Close any managed resources.
-
-        The fetcher is currently stateless after initialization, so there is
-        nothing to close. The method remains for context-manager symmetry.
+        """Close the pooled curl_cffi session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        """Return the curl_cffi session, creating it on first use.
+
+        Reusing one session keeps the TCP/TLS connection to fotmob.com alive
+        between API calls instead of handshaking per request. A fetcher is
+        owned by a single scraper (one per worker thread), so the session is
+        never shared across threads.
         """
-        pass
+        if self._session is None:
+            from curl_cffi import requests as curl_requests
+
+            self._session = curl_requests.Session()
+        return self._session
 
     # ------------------------------------------------------------------
     # x-mas token generation
@@ -293,37 +357,51 @@ class PlaywrightFetcher:
         }
         body_json = json.dumps(body, separators=(",", ":"))
         sig = hashlib.md5((body_json + self._h_lyrics).encode("utf-8")).hexdigest().upper()
-        token = {"body": body, "signature": sig}
-        return base64.b64encode(json.dumps(token, separators=(",", ":")).encode("utf-8")).decode(
-            "ascii"
-        )
+        # Same bytes as json.dumps({"body": body, "signature": sig}) with compact
+        # separators; splicing reuses body_json instead of serialising body twice.
+        token_json = f'{{"body":{body_json},"signature":"{sig}"}}'
+        return base64.b64encode(token_json.encode("utf-8")).decode("ascii")
 
     def _ensure_signing_params(self):
         """Keep signing params fresh; extract from the live page once per day."""
         if self._foo_hash and (time.time() - self._signing_params_ts) < self.SIGNING_PARAMS_TTL:
             return
 
-        try:
-            params = self._extract_signing_params_via_playwright()
-            self._foo_hash = params["foo"]
-            self._h_lyrics = params["h"]
-            self._signing_params_ts = time.time()
-            self.logger.info(f"x-mas signing params refreshed (foo={self._foo_hash[:12]}…)")
-        except Exception as exc:
-            if self._foo_hash:
-                self.logger.warning(
-                    f"Could not refresh signing params ({exc}); using cached values"
-                )
-            else:
-                self.logger.warning(
-                    f"Could not extract signing params ({exc}); using built-in fallback"
+        # Daily and match scrapers each own a fetcher; reuse params another
+        # fetcher already extracted instead of launching Chromium again.
+        with PlaywrightFetcher._signing_params_lock:
+            shared = PlaywrightFetcher._shared_signing_params
+            if shared is not None and (time.time() - shared[2]) < self.SIGNING_PARAMS_TTL:
+                self._foo_hash, self._h_lyrics, self._signing_params_ts = shared
+                return
+
+            try:
+                params = self._extract_signing_params_via_playwright()
+                self._foo_hash = params["foo"]
+                self._h_lyrics = params["h"]
+                self._signing_params_ts = time.time()
+                PlaywrightFetcher._shared_signing_params = (
+                    self._foo_hash,
+                    self._h_lyrics,
+                    self._signing_params_ts,
                 )
-                self._foo_hash = _FALLBACK_FOO_HASH
-                self._h_lyrics = _FALLBACK_H_LYRICS
+                self.logger.info(f"x-mas signing params refreshed (foo={self._foo_hash[:12]}…)")
+            except Exception as exc:
+                if self._foo_hash:
+                    self.logger.warning(
+                        f"Could not refresh signing params ({exc}); using cached values"
+                    )
+                else:
+                    self.logger.warning(
+                        f"Could not extract signing params ({exc}); using built-in fallback"
+                    )
+                    self._foo_hash = _FALLBACK_FOO_HASH
+                    self._h_lyrics = _FALLBACK_H_LYRICS
 
     def _extract_signing_params_via_playwright(self) -> Dict[str, str]:
         """Load fotmob.com briefly with Playwright to extract the signing params."""
         try:
+            from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
             from playwright.sync_api import sync_playwright
         except ImportError as exc:
             raise ImportError(
@@ -338,34 +416,19 @@ class PlaywrightFetcher:
             )
             try:
                 page = browser.new_page()
+                page.route("**/*", _skip_static_assets)
                 page.goto(
                     self.FOTMOB_BASE,
                     wait_until="domcontentloaded",
                     timeout=30_000,
                 )
-                page.wait_for_timeout(3_000)
-                result = page.evaluate(
-                    """
-                    () => {
-                        for (const chunk of (window.webpackChunk_N_E || [])) {
-                            const mm = chunk[1];
-                            if (!mm) continue;
-                            for (const [, factory] of Object.entries(mm)) {
-                                const code = factory.toString();
-                                if (code.includes('"x-mas"')) {
-                                    const fm = code.match(/"production:([a-f0-9]{40})"/);
-                                    const hi = code.indexOf('h=`') + 3;
-                                    return {
-                                        foo: fm ? fm[1] : null,
-                                        h: code.substring(hi, code.indexOf('`', hi))
-                                    };
-                                }
-                            }
-                        }
-                        return null;
-                    }
-                    """
-                )
+                # Poll until the webpack chunk with the signing code has loaded
+                # instead of sleeping a fixed 3s after DOMContentLoaded.
+                try:
+                    handle = page.wait_for_function(_SIGNING_PARAMS_JS, polling=250, timeout=10_000)
+                    result = handle.json_value()
+                except PlaywrightTimeoutError:
+                    result = None
             finally:
                 browser.close()
 
@@ -391,7 +454,7 @@ class PlaywrightFetcher:
         - Final result = Chrome cookies (if available) with the best available
           turnstile_verified injected on top.
         """
-        chrome_cookies = self._try_read_chrome_cookies()
+        chrome_cookies = self._get_chrome_cookies()
         stored_cookies = self._get_stored_credentials_cookies()
 
         # Determine the best turnstile_verified value
@@ -455,6 +518,19 @@ class PlaywrightFetcher:
         # Unknown format — accept it optimistically
         return True
 
+    def _get_chrome_cookies(self) -> Optional[Dict[str, str]]:
+        """Return Chrome's fotmob.com cookies, re-reading them at most every TTL.
+
+        browser-cookie3 copies and decrypts Chrome's cookie database for each
+        domain it is asked about, which is far costlier than the API call it
+        feeds. A fresh turnstile_verified from Chrome is still picked up within
+        CHROME_COOKIES_TTL seconds.
+        """
+        if time.time() - self._chrome_cookies_ts > self.CHROME_COOKIES_TTL:
+            self._chrome_cookies = self._try_read_chrome_cookies()
+            self._chrome_cookies_ts = time.time()
+        return self._chrome_cookies
+
     def _try_read_chrome_cookies(self) -> Optional[Dict[str, str]]:
         """Try to read fotmob.com cookies from the local Chrome profile.
 
@@ -499,24 +575,40 @@ class PlaywrightFetcher:
         return cookies if cookies else {}
 
     def _read_credentials_file_cookies(self) -> Optional[Dict[str, str]]:
-        """Directly read credentials.json from disk (bypasses startup cache)."""
+        """Read credentials.json from disk, re-parsing only after it changes.
+
+        The file is stat'ed on every call so refresh_turnstile.py updates are
+        picked up on the next request; the JSON is parsed only when its
+        mtime or size differs from the last read.
+        """
+        creds_path = _CREDENTIALS_PATH
         try:
-            creds_path = Path(__file__).parent.parent.parent.parent / "credentials.json"
-            if not creds_path.exists():
-                self.logger.warning(f"credentials.json not found at {creds_path}")
-                return None
+            st = creds_path.stat()
+        except FileNotFoundError:
+            self.logger.warning(f"credentials.json not found at {creds_path}")
+            return None
+        except OSError as exc:
+            self.logger.debug(f"Could not reload credentials.json: {exc}")
+            return None
+
+        file_key = (st.st_mtime_ns, st.st_size)
+        if self._credentials_cache is not None and self._credentials_cache[0] == file_key:
+            return self._credentials_cache[1]
 
-            with open(creds_path, "r") as f:
+        try:
+            with open(creds_path, "rb") as f:
                 data = json.load(f)
-                cookies = data.get("cookies", {})
-                self.logger.debug(
-                    f"credentials.json (live): {len(cookies)} cookie(s) "
-                    f"(turnstile_verified={'yes' if 'turnstile_verified' in cookies else 'no'})"
-                )
-                return cookies
+            cookies = data.get("cookies", {})
         except Exception as exc:
             self.logger.debug(f"Could not reload credentials.json: {exc}")
-        return None
+            return None
+
+        self.logger.debug(
+            f"credentials.json (live): {len(cookies)} cookie(s) "
+            f"(turnstile_verified={'yes' if 'turnstile_verified' in cookies else 'no'})"
+        )
+        self._credentials_cache = (file_key, cookies)
+        return cookies
 
     # ------------------------------------------------------------------
     # Context manager support
@@ -156,17 +156,18 @@ class BaseBronzeStorage(StorageProtocol, ABC):
             Path to saved file
         """
         try:
+            now = datetime.now()
             if date_str:
                 date_str_normalized = self._normalize_date(date_str)
             else:
-                date_str_normalized = datetime.now().strftime("%Y%m%d")
+                date_str_normalized = now.strftime("%Y%m%d")
 
             date_dir = self.matches_dir / date_str_normalized
             date_dir.mkdir(parents=True, exist_ok=True)
 
             file_path = date_dir / f"match_{match_id}.json"
             temp_path = date_dir / f".match_{match_id}.json.tmp"
-            scraped_at = datetime.now().isoformat()
+            scraped_at = now.isoformat()
 
             data_with_metadata = {
                 "match_id": match_id,
@@ -227,17 +228,18 @@ class BaseBronzeStorage(StorageProtocol, ABC):
             return []
 
         try:
+            now = datetime.now()
             if date_str:
                 date_str_normalized = self._normalize_date(date_str)
             else:
-                date_str_normalized = datetime.now().strftime("%Y%m%d")
+                date_str_normalized = now.strftime("%Y%m%d")
 
             date_dir = self.matches_dir / date_str_normalized
             date_dir.mkdir(parents=True, exist_ok=True)
 
             saved_paths = []
             failed_matches = []
-            scraped_at = datetime.now().isoformat()
+            scraped_at = now.isoformat()
 
             lock_path = date_dir / ".batch_write.lock"
 
@@ -306,21 +306,22 @@ class ClickHouseClient:
         full_table = f"{db}.{table}" if db else table
 
         try:
-            count_result = self.execute(f"SELECT COUNT(*) as count FROM {full_table}")
-            row_count = count_result.result_rows[0][0] if count_result.result_rows else 0
-
-            size_query = (
-                f"SELECT formatReadableSize(sum(bytes)) as size, sum(rows) as rows "
-                f"FROM system.parts WHERE database = '{db}' AND table = '{table}' AND active"
+            stats_query = (
+                f"SELECT (SELECT COUNT(*) FROM {full_table}) as count, "
+                f"formatReadableSize(sum(bytes)) as size, sum(rows) as rows "
+                "FROM system.parts "
+                "WHERE database = %(database)s AND table = %(table)s AND active"
+            )
+            stats_result = self.execute(stats_query, {"database": db, "table": table})
+            row_count, size, rows_in_parts = (
+                stats_result.result_rows[0] if stats_result.result_rows else (0, "0 B", 0)
             )
-            size_result = self.execute(size_query)
-            size_info = size_result.result_rows[0] if size_result.result_rows else ("0 B", 0)
 
             return {
                 "table": full_table,
                 "row_count": row_count,
-                "size": size_info[0],
-                "rows_in_parts": size_info[1],
+                "size": size,
+                "rows_in_parts": rows_in_parts,
             }
 
         except Exception as e:
@@ -44,13 +44,14 @@ class DeadLetterQueue:
         Returns:
             Path to DLQ file where record was written
         """
-        today = datetime.now().strftime("%Y%m%d")
+        now = datetime.now()
+        today = now.strftime("%Y%m%d")
         dlq_file = self.dlq_path / f"{table}_{today}.jsonl"
 
         data_serializable = self._serialize_data(data)
 
         record = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "table": table,
             "error": str(error),
             "context": context or {},
@@ -65,7 +65,8 @@ class S3Uploader:
             response = self.s3_client.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix)
             if response.get("Contents"):
                 return [
-                    obj["Key"].split("/")[-1].replace(".tar.gz", "") for obj in response["Contents"]
+                    obj["Key"].rpartition("/")[2].replace(".tar.gz", "")
+                    for obj in response["Contents"]
                 ]
         except Exception as e:
             # Arvan Cloud returns NoSuchKey (instead of an empty response) when no
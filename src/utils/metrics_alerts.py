@@ -186,10 +186,10 @@ class TelegramMetricsReporter:
         """Build a text-based progress bar."""
         if total == 0:
             return "[" + "░" * width + "] 0%"
-        percentage = (value / total) * 100
-        filled = int((value / total) * width) if total > 0 else 0
+        ratio = value / total
+        filled = int(ratio * width)
         bar = "█" * filled + "░" * (width - filled)
-        return f"[{bar}] {percentage:.1f}%"
+        return f"[{bar}] {ratio * 100:.1f}%"
 
     def _format_issue(self, issue: str, count: int) -> str:
         """Format a single issue line."""